@@ -1,16 +1,44 @@
 """Python API for cocotb-cpp runtime."""
 
-from ._native import Handle, Unit, get_precision, get_sim_time, unit_from_string, unit_to_string
-from .triggers import RisingEdge, Timer
+from __future__ import annotations
+
+import importlib
+
+# The native module resolves GPI symbols and only loads inside a simulator.
+# Its names are imported on first use so that cocotb_cpp.runner stays
+# importable from test runners.
+_LAZY = {
+    "Handle": "._native",
+    "Unit": "._native",
+    "get_precision": "._native",
+    "get_sim_time": "._native",
+    "set_values": "._native",
+    "unit_from_string": "._native",
+    "unit_to_string": "._native",
+    "RisingEdge": ".triggers",
+    "SignalHigh": ".triggers",
+    "Timer": ".triggers",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "Handle",
     "RisingEdge",
+    "SignalHigh",
     "Timer",
     "Unit",
     "get_precision",
     "get_sim_time",
+    "set_values",
     "unit_from_string",
     "unit_to_string",
 ]
-
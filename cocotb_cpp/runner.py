@@ -0,0 +1,77 @@
+"""Helpers for launching cocotb-cpp simulations from cocotb_tools runners.
+
+Nothing here touches the native module, so test runners can import it
+outside the simulator.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import os
+import shutil
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+
+# Where the package's shared libraries are installed
+PACKAGE_DIR = Path(__file__).resolve().parent
+
+
+@functools.cache
+def entry_library() -> Path:
+    """The cocotb_cpp_entry shared library, for ``GPI_USERS``."""
+    candidates = sorted(PACKAGE_DIR.glob("cocotb_cpp_entry*"))
+    shared = [p for p in candidates if p.suffix in {".so", ".dylib", ".pyd"}]
+    if not shared:
+        raise RuntimeError(f"Could not find cocotb_cpp_entry shared library in {PACKAGE_DIR}")
+    return shared[0]
+
+
+def build_digest(*inputs: str | Path) -> str:
+    """Hash build inputs; ``Path`` entries contribute their file contents."""
+    h = hashlib.blake2b(digest_size=16)
+    for item in inputs:
+        data = item.read_bytes() if isinstance(item, Path) else str(item).encode()
+        h.update(len(data).to_bytes(8, "little"))
+        h.update(data)
+    return h.hexdigest()
+
+
+def stamp_matches(stamp: Path, digest: str) -> bool:
+    return stamp.is_file() and stamp.read_text() == digest
+
+
+def write_stamp(stamp: Path, digest: str) -> None:
+    stamp.parent.mkdir(parents=True, exist_ok=True)
+    stamp.write_text(digest)
+
+
+def build_hdl(runner, sim: str, sources: Sequence[Path], hdl_toplevel: str, build_dir: Path) -> None:
+    """Build the HDL, reusing ``build_dir`` when it already holds this exact build."""
+    # WAVES is read by runner.build() and changes what gets compiled in
+    digest = build_digest(sim, hdl_toplevel, f"WAVES={os.getenv('WAVES', '')}", *sources)
+    stamp = build_dir / "hdl.hash"
+    rebuild = not stamp_matches(stamp, digest)
+    if rebuild:
+        shutil.rmtree(build_dir, ignore_errors=True)
+    runner.build(
+        sources=sources,
+        hdl_toplevel=hdl_toplevel,
+        build_dir=build_dir,
+        always=rebuild,
+    )
+    write_stamp(stamp, digest)
+
+
+def run_native_test(runner, hdl_toplevel: str, entry: tuple[Path, str], env: Mapping[str, str] | None = None) -> None:
+    """Run a simulation whose tests start from the native ``entry`` = (library, function)."""
+    library, function = entry
+    extra_env = {"GPI_USERS": f"{library},{function}", **(env or {})}
+    # do not check for xml results file for now
+    pytest_current_test = os.environ.pop("PYTEST_CURRENT_TEST", None)
+    try:
+        # No Python test module: the entry point selects what runs
+        runner.test(hdl_toplevel=hdl_toplevel, test_module=[], extra_env=extra_env)
+    finally:
+        if pytest_current_test is not None:
+            os.environ["PYTEST_CURRENT_TEST"] = pytest_current_test
@@ -2,16 +2,9 @@
 
 from __future__ import annotations
 
-from ._native import make_rising_edge_awaitable, make_timer_awaitable
-
-
-def RisingEdge(signal):
-    return make_rising_edge_awaitable(signal)
-
-
-def Timer(time, unit="step"):
-    return make_timer_awaitable(int(time), str(unit))
-
-
-__all__ = ["RisingEdge", "Timer"]
+# The native factories are the public triggers: no Python frame per await.
+from ._native import make_rising_edge_awaitable as RisingEdge
+from ._native import make_signal_high_awaitable as SignalHigh
+from ._native import make_timer_awaitable as Timer
 
+__all__ = ["RisingEdge", "SignalHigh", "Timer"]
@@ -4,75 +4,127 @@
 
 
 #include <cocotb.h>
+#include <cstdint>
+#include <vector>
 
 using namespace cocotb;
 
 class AxiLiteDriver {
   public:
-    AxiLiteDriver(const Dut &dut, const Handle &clk) : dut_(dut), clk_(clk) {}
+    // Signal handles are resolved once here rather than looked up by name
+    // on every access.
+    AxiLiteDriver(const Dut &dut, const Handle &clk)
+        : clk_(clk),
+          awaddr_(dut["AWADDR"]),
+          awvalid_(dut["AWVALID"]),
+          awready_(dut["AWREADY"]),
+          wdata_(dut["WDATA"]),
+          wstrb_(dut["WSTRB"]),
+          wvalid_(dut["WVALID"]),
+          wready_(dut["WREADY"]),
+          bvalid_(dut["BVALID"]),
+          bready_(dut["BREADY"]),
+          araddr_(dut["ARADDR"]),
+          arvalid_(dut["ARVALID"]),
+          arready_(dut["ARREADY"]),
+          rdata_(dut["RDATA"]),
+          rvalid_(dut["RVALID"]),
+          rready_(dut["RREADY"]) {}
 
     task<> reset() {
-        dut_["AWVALID"].value = 0;
-        dut_["WVALID"].value = 0;
-        dut_["BREADY"].value = 0;
-        dut_["ARVALID"].value = 0;
-        dut_["RREADY"].value = 0;
+        awvalid_.value = 0;
+        wvalid_.value = 0;
+        bready_.value = 0;
+        arvalid_.value = 0;
+        rready_.value = 0;
         co_await RisingEdge(clk_);
     }
 
     task<> write(uint32_t addr, uint32_t data, uint32_t wstrb = 0xF) {
-        dut_["AWADDR"].value = addr;
-        dut_["AWVALID"].value = 1;
+        awaddr_.value = addr;
+        awvalid_.value = 1;
 
-        dut_["WDATA"].value = data;
-        dut_["WSTRB"].value = wstrb;
-        dut_["WVALID"].value = 1;
+        wdata_.value = data;
+        wstrb_.value = wstrb;
+        wvalid_.value = 1;
 
+        // AW, W and B handshakes share one clock loop; each VALID is dropped
+        // on the edge it is accepted. A handshake completes on the clock edge
+        // where VALID and READY are both high, so nothing is sampled earlier.
+        bool aw_done = false;
+        bool w_done = false;
+        bool b_wait = false;
         while (true) {
             co_await RisingEdge(clk_);
-            if (dut_["AWREADY"].value && dut_["WREADY"].value) {
-                break;
+            if (b_wait) {
+                if (bvalid_.value) {
+                    break;
+                }
+                continue;
             }
-        }
-
-        dut_["AWVALID"].value = 0;
-        dut_["WVALID"].value = 0;
-
-        dut_["BREADY"].value = 1;
-        while (true) {
-            co_await RisingEdge(clk_);
-            if (dut_["BVALID"].value) {
-                break;
+            if (!aw_done && awready_.value) {
+                awvalid_.value = 0;
+                aw_done = true;
+            }
+            if (!w_done && wready_.value) {
+                wvalid_.value = 0;
+                w_done = true;
+            }
+            if (aw_done && w_done) {
+                bready_.value = 1;
+                b_wait = true;
             }
         }
-        dut_["BREADY"].value = 0;
+        bready_.value = 0;
     }
 
     task<> read(uint32_t addr, uint32_t &out_data) {
-        dut_["ARADDR"].value = addr;
-        dut_["ARVALID"].value = 1;
+        araddr_.value = addr;
+        arvalid_.value = 1;
 
+        bool ar_done = false;
         while (true) {
             co_await RisingEdge(clk_);
-            if (dut_["ARREADY"].value) {
-                break;
+            if (ar_done) {
+                if (rvalid_.value) {
+                    out_data = static_cast<uint32_t>(rdata_.value);
+                    break;
+                }
+            } else if (arready_.value) {
+                arvalid_.value = 0;
+                rready_.value = 1;
+                ar_done = true;
             }
         }
+        rready_.value = 0;
+    }
 
-        dut_["ARVALID"].value = 0;
-
-        dut_["RREADY"].value = 1;
-        while (true) {
-            co_await RisingEdge(clk_);
-            if (dut_["RVALID"].value) {
-                out_data = static_cast<uint32_t>(dut_["RDATA"].value);
-                break;
-            }
+    // Runs a write of (writes[2 * i], writes[2 * i + 1]) followed by a read of
+    // reads[i] for every i, storing read data in out_data. The vectors must
+    // outlive the returned task.
+    task<> write_read_batch(const std::vector<uint32_t> &writes, const std::vector<uint32_t> &reads, std::vector<uint32_t> &out_data) {
+        out_data.resize(reads.size());
+        for (size_t i = 0; i < reads.size(); ++i) {
+            co_await write(writes[2 * i], writes[2 * i + 1]);
+            co_await read(reads[i], out_data[i]);
         }
-        dut_["RREADY"].value = 0;
     }
 
   private:
-    Handle dut_;
     Handle clk_;
+    Handle awaddr_;
+    Handle awvalid_;
+    Handle awready_;
+    Handle wdata_;
+    Handle wstrb_;
+    Handle wvalid_;
+    Handle wready_;
+    Handle bvalid_;
+    Handle bready_;
+    Handle araddr_;
+    Handle arvalid_;
+    Handle arready_;
+    Handle rdata_;
+    Handle rvalid_;
+    Handle rready_;
 };
@@ -6,8 +6,10 @@
 #include <memory>
 #include <stdexcept>
 #include <string>
+#include <vector>
 
 #include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
 
 #include <cocotb_nanobind.h>
 #include <cocotb_python_op.h>
@@ -41,9 +43,7 @@ class PyAxiLiteDriver {
         return cocotb_cpp::make_python_op_awaitable(
             cocotb_cpp::PythonOpResultKind::None,
             [driver](const std::shared_ptr<cocotb_cpp::PythonOpState> &state) {
-                return cocotb_cpp::run_python_op(state, "axil: run_reset", [driver]() -> cocotb::task<> {
-                    co_await driver->reset();
-                });
+                return cocotb_cpp::run_python_op(state, "axil: run_reset", [driver]() { return driver->reset(); });
             },
             "axil: reset"
         );
@@ -54,9 +54,7 @@ class PyAxiLiteDriver {
         return cocotb_cpp::make_python_op_awaitable(
             cocotb_cpp::PythonOpResultKind::None,
             [driver, addr, data, wstrb](const std::shared_ptr<cocotb_cpp::PythonOpState> &state) {
-                return cocotb_cpp::run_python_op(state, "axil: run_write", [driver, addr, data, wstrb]() -> cocotb::task<> {
-                    co_await driver->write(addr, data, wstrb);
-                });
+                return cocotb_cpp::run_python_op(state, "axil: run_write", [driver, addr, data, wstrb]() { return driver->write(addr, data, wstrb); });
             },
             "axil: write"
         );
@@ -67,16 +65,34 @@ class PyAxiLiteDriver {
         return cocotb_cpp::make_python_op_awaitable(
             cocotb_cpp::PythonOpResultKind::U32,
             [driver, addr](const std::shared_ptr<cocotb_cpp::PythonOpState> &state) {
-                return cocotb_cpp::run_python_op(state, "axil: run_read", [driver, addr, state]() -> cocotb::task<> {
-                    uint32_t out = 0;
-                    co_await driver->read(addr, out);
-                    state->value_u32 = out;
-                });
+                // The driver writes straight into the op state, which the factory keeps alive.
+                return cocotb_cpp::run_python_op(state, "axil: run_read", [driver, addr, state]() { return driver->read(addr, state->value_u32); });
             },
             "axil: read"
         );
     }
 
+    nb::object submit_batch(nb::ndarray<const uint32_t, nb::shape<-1, 2>, nb::c_contig, nb::device::cpu> writes,
+                            nb::ndarray<const uint32_t, nb::ndim<1>, nb::c_contig, nb::device::cpu> reads) {
+        if (writes.shape(0) != reads.shape(0)) {
+            throw std::runtime_error("AxiLiteDriver.submit_batch expects one read address per write.");
+        }
+        // Copy the batch so it outlives the Python arrays while the op runs.
+        std::vector<uint32_t> write_words(writes.data(), writes.data() + writes.size());
+        std::vector<uint32_t> read_addrs(reads.data(), reads.data() + reads.size());
+        auto driver = driver_;
+        return cocotb_cpp::make_python_op_awaitable(
+            cocotb_cpp::PythonOpResultKind::U32Array,
+            [driver, write_words = std::move(write_words), read_addrs = std::move(read_addrs)](const std::shared_ptr<cocotb_cpp::PythonOpState> &state) mutable {
+                return cocotb_cpp::run_python_op(
+                    state, "axil: run_batch", [driver, write_words = std::move(write_words), read_addrs = std::move(read_addrs), state]() {
+                        return driver->write_read_batch(write_words, read_addrs, state->values_u32);
+                    });
+            },
+            "axil: batch"
+        );
+    }
+
   private:
     cocotb::Dut dut_;
     cocotb::Handle clk_;
@@ -92,5 +108,6 @@ NB_MODULE(axil, m) {
         .def(nb::init<const nb::object &, const nb::object &>(), "dut"_a, "clk"_a)
         .def("reset", &PyAxiLiteDriver::reset)
         .def("write", &PyAxiLiteDriver::write, "addr"_a, "data"_a, "wstrb"_a = 0xF)
-        .def("read", &PyAxiLiteDriver::read, "addr"_a);
+        .def("read", &PyAxiLiteDriver::read, "addr"_a)
+        .def("submit_batch", &PyAxiLiteDriver::submit_batch, "writes"_a, "reads"_a);
 }
@@ -2,37 +2,72 @@
 # SPDX-License-Identifier: CC0-1.0
 from __future__ import annotations
 
-import importlib.util
 import os
 from pathlib import Path
 import random
-import shutil
 
+import numpy as np
+from cocotb_cpp.runner import build_hdl, entry_library, run_native_test
 from cocotb_tools.runner import get_runner
 
 async def axil_cpp_py_simple_test(dut):
-    from cocotb_cpp.triggers import RisingEdge, Timer
+    from cocotb_cpp.triggers import SignalHigh, Timer
     from axil_ext import AxiLiteDriver
 
     clk = dut.ACLK
     driver = AxiLiteDriver(dut, clk)
 
     await driver.reset()
-    while dut.ARESETn.value == 0:
-        await RisingEdge(clk)
+    await SignalHigh(dut.ARESETn)
 
+    # Seeded from the global RNG rather than pinned to one workload
+    rng = np.random.default_rng(random.getrandbits(64))
     mem = [0] * 1024
 
-    for _ in range(1000000):
-        addr = random.randint(0, 1023)
-        data = random.randint(0, 0xFFFFFFFF)
+    # Per-op path: each write/read is awaited from Python on its own
+    n_ops = 10000
+    for addr, data, addr_rd in zip(
+        rng.integers(0, 1024, size=n_ops).tolist(),
+        rng.integers(0, 1 << 32, size=n_ops).tolist(),
+        rng.integers(0, 1024, size=n_ops).tolist(),
+    ):
         mem[addr] = data
-        await driver.write(addr * 4, data)
+        await driver.write(addr << 2, data)
 
-        addr_rd = random.randint(0, 1023)
-        data_rd = await driver.read(addr_rd * 4)
+        data_rd = await driver.read(addr_rd << 2)
         assert data_rd == mem[addr_rd], f"Read back address {addr_rd} 0x{data_rd:08X} from memory 0x{mem[addr_rd]:08X}"
 
+    # Batched path: the whole workload runs back to back in C++
+    n = 1000000
+    addrs = rng.integers(0, 1024, size=n, dtype=np.uint32)
+    datas = rng.integers(0, 1 << 32, size=n, dtype=np.uint32)
+    addrs_rd = rng.integers(0, 1024, size=n, dtype=np.uint32)
+
+    # Transaction i writes writes[i] = (address, data), then reads reads[i]
+    writes = np.column_stack((addrs << 2, datas))
+    reads = addrs_rd << 2
+
+    # Each read returns the last value written to its address at or before
+    # it, or what the per-op phase left there. Writes are sorted by
+    # (address, index) so one searchsorted finds that write for every read.
+    idx = np.arange(n, dtype=np.int64)
+    write_keys = addrs.astype(np.int64) * n + idx
+    order = np.argsort(write_keys)
+    sorted_keys = write_keys[order]
+    pos = np.searchsorted(sorted_keys, addrs_rd.astype(np.int64) * n + idx, side="right") - 1
+    hit = pos >= 0
+    pos = np.maximum(pos, 0)
+    hit &= (sorted_keys[pos] // n) == addrs_rd
+    expected = np.where(hit, datas[order[pos]], np.array(mem, dtype=np.uint32)[addrs_rd])
+
+    # The batch result is a uint32 memoryview; wrap it without copying
+    read_data = np.asarray(await driver.submit_batch(writes, reads))
+    if not np.array_equal(read_data, expected):
+        i = int(np.argmax(read_data != expected))
+        raise AssertionError(
+            f"Transaction {i}: read back 0x{int(read_data[i]):08X} from address {int(addrs_rd[i])}, expected 0x{int(expected[i]):08X}"
+        )
+
     await driver.write(0x100, 0xDEADBEEF)
     data = await driver.read(0x100)
     assert data == 0xDEADBEEF, f"Read back 0x{data:08X}"
@@ -40,48 +75,24 @@ async def axil_cpp_py_simple_test(dut):
     await Timer(10, unit="ns")
 
 
-def _get_installed_pkg_dir(pkg_name: str) -> Path:
-    spec = importlib.util.find_spec(pkg_name)
-    if spec is None or not spec.submodule_search_locations:
-        raise RuntimeError(f"{pkg_name} is not installed")
-    return Path(next(iter(spec.submodule_search_locations))).resolve()
-
-
-def _get_installed_cocotb_cpp_entry_path() -> Path:
-    pkg_dir = _get_installed_pkg_dir("cocotb_cpp")
-    candidates = sorted(pkg_dir.glob("cocotb_cpp_entry*"))
-    shared = [p for p in candidates if p.suffix in {".so", ".dylib", ".pyd"}]
-    if not shared:
-        raise RuntimeError(f"Could not find cocotb_cpp_entry shared library in {pkg_dir}")
-    return shared[0]
 
 
 def test_axil_ext_runner():
-    shutil.rmtree("sim_build", ignore_errors=True)
-
     repo_root = Path(__file__).resolve().parents[3]
 
     sim = os.getenv("SIM", "icarus")
     sources = [repo_root / "tests" / "axil.sv"]
 
     runner = get_runner(sim)
-    runner.build(
-        sources=sources,
-        hdl_toplevel="top",
-        always=True,
-    )
-
-    entry_so = _get_installed_cocotb_cpp_entry_path()
+    build_hdl(runner, sim, sources, hdl_toplevel="top", build_dir=Path("sim_build").resolve() / "test_axil_ext_runner")
 
-    extra_env = {
-        "GPI_USERS": f"{entry_so},cocotb_entry_point",
+    env = {
         "COCOTB_MODULE": "test_axil_ext",
         "COCOTB_TEST": "axil_cpp_py_simple_test",
         "COCOTB_CPP_TESTS": str(Path(__file__).resolve().parent),
     }
-
-    os.environ.pop("PYTEST_CURRENT_TEST", None)
-    runner.test(hdl_toplevel="top", test_module="", extra_env=extra_env)
+    entry = (entry_library(), "cocotb_entry_point")
+    run_native_test(runner, hdl_toplevel="top", entry=entry, env=env)
 
 
 if __name__ == "__main__":
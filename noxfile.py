@@ -5,17 +5,22 @@ import nox
 nox.options.sessions = ["tests", "axil_ext_tests"]
 
 
-def _install_base(session: nox.Session) -> None:
+def _install_base(session: nox.Session, *package_args: str) -> None:
     session.install("pytest")
     session.install("pytest-timeout")
-    session.install(".")
+    session.install("numpy")
+    session.install("pytest-xdist")
+    session.install(*package_args, ".")
 
 
 @nox.session
 def tests(session: nox.Session) -> None:
     """Run core cocotb-cpp tests in an isolated environment."""
-    _install_base(session)
-    session.run("pytest", "-s", "tests")
+    # Also install the prebuilt C++ test libraries, so tests/ can skip CMake
+    _install_base(session, "-Ccmake.define.COCOTB_CPP_TEST_LIBS=ON")
+    # xdist workers do not forward -s output; captured simulator logs are
+    # still reported for failing tests.
+    session.run("pytest", "-n", "auto", "tests")
 
 
 @nox.session(name="axil_ext_tests")
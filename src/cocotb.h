@@ -405,6 +405,17 @@ class RisingEdge {
     Handle signal_;
 };
 
+class ValueChange {
+  public:
+    explicit ValueChange(Handle signal) : signal_(signal) {}
+    bool await_ready() const noexcept { return false; }
+    void await_suspend(std::coroutine_handle<> handle) const { Scheduler::instance().schedule_on_edge(handle, signal_.raw(), GPI_VALUE_CHANGE); }
+    void await_resume() const noexcept {}
+
+  private:
+    Handle signal_;
+};
+
 inline void Scheduler::set_dut_handle(gpi_sim_hdl handle) {
     dut_handle_ = handle;
     dut_.reset();
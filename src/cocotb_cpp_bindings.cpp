@@ -6,6 +6,7 @@
 #include <string>
 
 #include <nanobind/nanobind.h>
+#include <nanobind/stl/pair.h>
 
 #include <cocotb_nanobind.h>
 
@@ -54,16 +55,49 @@ class SimHandle {
     std::string path_;
 };
 
-nb::object make_timer_awaitable(uint64_t delay, const std::string &unit_name) {
-    nb::tuple payload = nb::make_tuple(delay, unit_name);
-    return cocotb_cpp::make_python_awaitable("timer", payload);
+nb::object make_timer_awaitable(const nb::handle &time, const nb::handle &unit) {
+    // Plain int/str objects go into the payload as-is; anything else is
+    // coerced the same way int() and str() would.
+    nb::object delay = PyLong_CheckExact(time.ptr()) ? nb::borrow(time) : nb::steal(PyNumber_Long(time.ptr()));
+    if (!delay.is_valid()) {
+        throw nb::python_error();
+    }
+    if (PyObject_RichCompareBool(delay.ptr(), nb::int_(0).ptr(), Py_LT) == 1) {
+        throw nb::value_error("Timer delay must be non-negative.");
+    }
+    nb::object unit_name = PyUnicode_CheckExact(unit.ptr()) ? nb::borrow(unit) : nb::steal(PyObject_Str(unit.ptr()));
+    if (!unit_name.is_valid()) {
+        throw nb::python_error();
+    }
+    return cocotb_cpp::make_python_awaitable("timer", nb::make_tuple(delay, unit_name));
+}
+
+std::string signal_path(const nb::object &signal) {
+    // Native handles know their path; other handles are asked through attributes.
+    if (nb::isinstance<SimHandle>(signal)) {
+        return nb::cast<const SimHandle &>(signal).path();
+    }
+    return cocotb_cpp::get_path_from_py_handle(signal);
 }
 
 nb::object make_rising_edge_awaitable(const nb::object &signal) {
-    const std::string path = cocotb_cpp::get_path_from_py_handle(signal);
+    const std::string path = signal_path(signal);
     return cocotb_cpp::make_python_awaitable("rising_edge", nb::str(path.c_str()));
 }
 
+nb::object make_signal_high_awaitable(const nb::object &signal) {
+    const std::string path = signal_path(signal);
+    return cocotb_cpp::make_python_awaitable("signal_high", nb::str(path.c_str()));
+}
+
+void set_values(const nb::iterable &pairs) {
+    // Assign all (handle, value) pairs from a single Python call.
+    for (nb::handle item : pairs) {
+        auto [handle, value] = nb::cast<std::pair<SimHandle *, int64_t>>(item);
+        handle->set(static_cast<uint32_t>(value));
+    }
+}
+
 } // namespace
 
 NB_MODULE(_native, m) {
@@ -96,8 +130,12 @@ NB_MODULE(_native, m) {
 
     m.def("get_precision", &cocotb::get_precision);
     m.def("get_sim_time", &cocotb::get_sim_time, "time_unit"_a = cocotb::unit::step);
+    m.def("set_values", &set_values, "pairs"_a, "Assign each (Handle, int) pair in order.");
     m.def("unit_to_string", [](cocotb::unit u) { return std::string(cocotb_cpp::common::unit_to_string(u)); }, "unit"_a);
     m.def("unit_from_string", [](const std::string &unit_name) { return cocotb_cpp::common::unit_from_string(unit_name); }, "unit_name"_a);
-    m.def("make_timer_awaitable", &make_timer_awaitable, "delay"_a, "unit_name"_a = "step");
+    // Exported as Timer/RisingEdge/SignalHigh by cocotb_cpp.triggers, so the
+    // argument names here are the public ones.
+    m.def("make_timer_awaitable", &make_timer_awaitable, "time"_a, "unit"_a = "step");
     m.def("make_rising_edge_awaitable", &make_rising_edge_awaitable, "signal"_a);
+    m.def("make_signal_high_awaitable", &make_signal_high_awaitable, "signal"_a, "Resume once the single-bit signal is high, waiting on value changes in C++. Only the low 32 bits of the value are checked, so wider signals are not supported.");
 }
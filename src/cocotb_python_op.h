@@ -14,6 +14,7 @@
 #include <string>
 #include <string_view>
 #include <utility>
+#include <vector>
 
 #include <cocotb.h>
 
@@ -22,6 +23,7 @@ namespace cocotb_cpp {
 enum class PythonOpResultKind : uint8_t {
     None = 0,
     U32 = 1,
+    U32Array = 2,
 };
 
 // Shared op state transported from nanobind extension to the C++ Python runner.
@@ -31,6 +33,7 @@ struct PythonOpState {
     cocotb::task<>::handle_type handle{};
     PythonOpResultKind result_kind{PythonOpResultKind::None};
     uint32_t value_u32{0};
+    std::vector<uint32_t> values_u32;
     std::string error;
 };
 
@@ -12,6 +12,7 @@
 #include <stdexcept>
 #include <string>
 #include <string_view>
+#include <vector>
 
 #include <cocotb_cpp_common.h>
 #include <cocotb_python_op.h>
@@ -165,8 +166,24 @@ inline void append_env_single_path(const char *env_name) {
     }
 }
 
+// Returns the values as a memoryview of format 'I' over a single bytes buffer,
+// so a large result costs one allocation instead of one int object per value.
+inline PyObject *u32_view_from_vector(const std::vector<uint32_t> &values) {
+    static_assert(sizeof(unsigned int) == sizeof(uint32_t), "format 'I' must be 32 bits wide");
+    PyRef bytes(PyBytes_FromStringAndSize(reinterpret_cast<const char *>(values.data()),
+                                          static_cast<Py_ssize_t>(values.size() * sizeof(uint32_t))));
+    if (!bytes) {
+        return nullptr;
+    }
+    PyRef view(PyMemoryView_FromObject(bytes.get()));
+    if (!view) {
+        return nullptr;
+    }
+    return PyObject_CallMethod(view.get(), "cast", "s", "I");
+}
+
 struct AwaitSpec {
-    enum class Kind { Timer, RisingEdge, Op } kind;
+    enum class Kind { Timer, RisingEdge, SignalHigh, Op } kind;
     uint64_t delay{0};
     cocotb::unit unit{cocotb::unit::step};
     std::string path;
@@ -224,6 +241,16 @@ inline AwaitSpec parse_awaitable(PyObject *yielded) {
         return spec;
     }
 
+    if (kind == "signal_high") {
+        const char *path_cstr = PyUnicode_AsUTF8(payload.get());
+        if (!path_cstr) {
+            throw std::runtime_error(fetch_python_error());
+        }
+        spec.kind = AwaitSpec::Kind::SignalHigh;
+        spec.path = path_cstr;
+        return spec;
+    }
+
     if (kind == "op") {
         if (!PyCapsule_CheckExact(payload.get())) {
             throw std::runtime_error("Op awaitable payload must be a capsule.");
@@ -361,8 +388,9 @@ inline cocotb::task<> run_python_test(cocotb::Dut &dut) {
         }
 
         if (debug) {
-            const char *k = spec.kind == detail::AwaitSpec::Kind::Timer      ? "timer"
+            const char *k = spec.kind == detail::AwaitSpec::Kind::Timer        ? "timer"
                             : spec.kind == detail::AwaitSpec::Kind::RisingEdge ? "rising_edge"
+                            : spec.kind == detail::AwaitSpec::Kind::SignalHigh ? "signal_high"
                                                                                : "op";
             cocotb::log.info(std::format("cocotb_cpp: yielded {}", k));
         }
@@ -389,6 +417,23 @@ inline cocotb::task<> run_python_test(cocotb::Dut &dut) {
             continue;
         }
 
+        if (spec.kind == detail::AwaitSpec::Kind::SignalHigh) {
+            cocotb::Handle h(common::resolve_handle_from_path(spec.path));
+            if (!h.valid()) {
+                throw std::runtime_error("Failed to resolve signal path for SignalHigh: " + spec.path);
+            }
+            // Wait in C++ so Python is resumed once, when the value is non-zero.
+            // Single-bit trigger: only the low 32 bits of the value are seen.
+            while (static_cast<uint32_t>(h.value) == 0) {
+                co_await cocotb::ValueChange(h);
+            }
+            PyGILState_STATE gil = PyGILState_Ensure();
+            Py_INCREF(Py_None);
+            send_value.reset(Py_None);
+            PyGILState_Release(gil);
+            continue;
+        }
+
         if (!spec.op_state->handle) {
             throw std::runtime_error("Op state has empty coroutine handle.");
         }
@@ -410,6 +455,8 @@ inline cocotb::task<> run_python_test(cocotb::Dut &dut) {
                 send_value.reset(Py_None);
             } else if (spec.op_state->result_kind == cocotb_cpp::PythonOpResultKind::U32) {
                 send_value.reset(PyLong_FromUnsignedLong(spec.op_state->value_u32));
+            } else if (spec.op_state->result_kind == cocotb_cpp::PythonOpResultKind::U32Array) {
+                send_value.reset(detail::u32_view_from_vector(spec.op_state->values_u32));
             } else {
                 PyGILState_Release(gil);
                 throw std::runtime_error("Unsupported op result kind.");
@@ -3,31 +3,79 @@
 
 from __future__ import annotations
 
+from collections import deque
 from pathlib import Path
 import subprocess
+import sys
 
+import cocotb_tools.config
+from cocotb_cpp.runner import PACKAGE_DIR, build_digest, stamp_matches, write_stamp
 
-def run_cmd(cmd: list[str]) -> None:
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.returncode != 0:
+
+def run_cmd(cmd: list[str], tail_lines: int = 200) -> None:
+    # Stream output as it arrives, keeping only the tail for the error message
+    tail: deque[str] = deque(maxlen=tail_lines)
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1) as proc:
+        for line in proc.stdout:
+            sys.stdout.write(line)
+            tail.append(line)
+    if proc.returncode != 0:
         raise RuntimeError(
-            "Command failed:\n"
+            f"Command failed (exit code {proc.returncode}):\n"
             + " ".join(cmd)
-            + f"\nstdout:\n{result.stdout}\nstderr:\n{result.stderr}"
+            + f"\nlast {len(tail)} lines of output:\n"
+            + "".join(tail)
         )
 
 
+def sim_build_dir(test_name: str) -> Path:
+    """Per-test build directory, so runners can build and run in parallel."""
+    build_dir = (Path("sim_build") / test_name).resolve()
+    build_dir.mkdir(parents=True, exist_ok=True)
+    return build_dir
+
+
 def build_cpp_test_lib(proj_path: Path, target: str, output_name: str) -> Path:
     repo_root = proj_path.parent
-    build_dir = repo_root / "build" / "pytest-cmake-tests"
-    run_cmd([
+    build_dir = repo_root / "build" / "pytest-cmake-tests" / target
+    configure_cmd = [
         "cmake",
         "-S",
         str(proj_path),
         "-B",
         str(build_dir),
         f"-DCOCOTB_CPP_SOURCE_DIR={repo_root}",
+        f"-DPython_EXECUTABLE={sys.executable}",
         "-DCMAKE_BUILD_TYPE=Release",
-    ])
+    ]
+    # The build step re-runs configure itself when CMakeLists.txt changes,
+    # so an explicit configure is only needed when its arguments or the
+    # Python/cocotb installation it discovers change. The build tree is
+    # shared between the local venv and the nox venvs.
+    stamp = build_dir / "configure.hash"
+    digest = build_digest(*configure_cmd, cocotb_tools.config.share_dir)
+    if not stamp_matches(stamp, digest):
+        run_cmd(configure_cmd)
+        write_stamp(stamp, digest)
     run_cmd(["cmake", "--build", str(build_dir), "--target", target, "--parallel"])
     return (build_dir / f"{output_name}.so").resolve()
+
+
+def prebuilt_cpp_test_lib(proj_path: Path, source: str, output_name: str) -> Path | None:
+    """Test library installed with cocotb_cpp, or None if missing or older than its inputs."""
+    lib = PACKAGE_DIR / "_tests" / f"{output_name}.so"
+    if not lib.is_file():
+        return None
+    repo_root = proj_path.parent
+    inputs = [
+        proj_path / source,
+        proj_path / "cocotb_cpp_test_lib.cmake",
+        repo_root / "CMakeLists.txt",
+        *(repo_root / "src").iterdir(),
+        *(Path(cocotb_tools.config.share_dir) / "include").glob("*.h"),
+    ]
+    built = lib.stat().st_mtime
+    if any(path.stat().st_mtime > built for path in inputs):
+        return None
+    return lib
+
@@ -0,0 +1,29 @@
+# Shared by tests/CMakeLists.txt and the root project (COCOTB_CPP_TEST_LIBS),
+# so prebuilt and locally built test libraries share one definition.
+# Expects COCOTB_CPP_SOURCE_DIR and COCOTB_INCLUDE_DIR to be set.
+
+include(CheckIPOSupported)
+check_ipo_supported(RESULT cocotb_cpp_test_ipo LANGUAGES CXX)
+
+# Pass PORTABLE for libraries installed with the package; the others only run
+# on the machine that built them and are tuned for it.
+function(add_cocotb_cpp_test_lib target source output_name)
+    cmake_parse_arguments(PARSE_ARGV 3 arg "PORTABLE" "" "")
+    add_library(${target} SHARED "${source}" "${COCOTB_CPP_SOURCE_DIR}/src/cocotb_core.cpp")
+    target_compile_features(${target} PRIVATE cxx_std_20)
+    target_compile_options(${target} PRIVATE -Wall -Wextra -Wpedantic)
+    if (NOT arg_PORTABLE)
+        target_compile_options(${target} PRIVATE $<$<CONFIG:Release>:-march=native> $<$<CONFIG:Release>:-fno-plt>)
+    endif()
+    target_include_directories(${target}
+        PRIVATE
+            "${COCOTB_CPP_SOURCE_DIR}"
+            "${COCOTB_CPP_SOURCE_DIR}/src"
+            "${COCOTB_CPP_SOURCE_DIR}/examples/axil_ext/src"
+            "${COCOTB_INCLUDE_DIR}"
+    )
+    set_target_properties(${target} PROPERTIES PREFIX "" OUTPUT_NAME "${output_name}")
+    if (cocotb_cpp_test_ipo)
+        set_target_properties(${target} PROPERTIES INTERPROCEDURAL_OPTIMIZATION_RELEASE ON)
+    endif()
+endfunction()
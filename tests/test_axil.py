@@ -4,18 +4,30 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
-import shutil
-import random
 import pytest
-import importlib.util
+import random
 
 import cocotb
+import numpy as np
 
-if os.getenv("COCOTB_CPP_TESTS", "0") != "0":
+COCOTB_CPP = os.getenv("COCOTB_CPP_TESTS", "0") != "0"
+
+if COCOTB_CPP:
+    from cocotb_cpp import Handle, set_values
     from cocotb_cpp.triggers import RisingEdge, Timer
+
+    # Native handles return the signal value as a plain int
+    get_uint32 = Handle.get
 else:
     from cocotb.triggers import RisingEdge, Timer
 
+    def set_values(pairs):
+        for handle, value in pairs:
+            handle.value = value
+
+    def get_uint32(handle):
+        return int(handle.value)
+
 def conditional_cocotb_test():
     if os.getenv("COCOTB_CPP_TESTS", "0") != "0":
         # Return identity decorator (does nothing)
@@ -26,71 +38,104 @@ def conditional_cocotb_test():
         return cocotb.test()
         
 from cocotb_tools.runner import get_runner
-from cmake_build import build_cpp_test_lib
+from cocotb_cpp.runner import build_hdl, entry_library, run_native_test
+from cmake_build import sim_build_dir
 
 class AxiLiteDriver:
     def __init__(self, dut, clk):
         self.dut = dut
         self.clk = clk
 
+        # Resolve signal handles once instead of on every access
+        self.awaddr = dut.AWADDR
+        self.awvalid = dut.AWVALID
+        self.awready = dut.AWREADY
+        self.wdata = dut.WDATA
+        self.wstrb = dut.WSTRB
+        self.wvalid = dut.WVALID
+        self.wready = dut.WREADY
+        self.bvalid = dut.BVALID
+        self.bready = dut.BREADY
+        self.araddr = dut.ARADDR
+        self.arvalid = dut.ARVALID
+        self.arready = dut.ARREADY
+        self.rdata = dut.RDATA
+        self.rvalid = dut.RVALID
+        self.rready = dut.RREADY
+
     async def reset(self):
-        self.dut.AWVALID.value = 0
-        self.dut.WVALID.value = 0
-        self.dut.BREADY.value = 0
-        self.dut.ARVALID.value = 0
-        self.dut.RREADY.value = 0
+        self.awvalid.value = 0
+        self.wvalid.value = 0
+        self.bready.value = 0
+        self.arvalid.value = 0
+        self.rready.value = 0
         await RisingEdge(self.clk)
 
     async def write(self, addr, data, wstrb=0xF):
-        # Write address
-        self.dut.AWADDR.value = addr
-        self.dut.AWVALID.value = 1
-
-        # Write data
-        self.dut.WDATA.value = data
-        self.dut.WSTRB.value = wstrb
-        self.dut.WVALID.value = 1
-
-        # Wait for address and data handshake
+        # Write address and data, in one native call under cocotb_cpp
+        if COCOTB_CPP:
+            set_values(
+                (
+                    (self.awaddr, addr),
+                    (self.awvalid, 1),
+                    (self.wdata, data),
+                    (self.wstrb, wstrb),
+                    (self.wvalid, 1),
+                )
+            )
+        else:
+            self.awaddr.value = addr
+            self.awvalid.value = 1
+            self.wdata.value = data
+            self.wstrb.value = wstrb
+            self.wvalid.value = 1
+
+        # Address, data and response handshakes share one clock loop;
+        # each VALID is dropped on the edge it is accepted.
+        aw_done = False
+        w_done = False
+        b_wait = False
         while True:
             await RisingEdge(self.clk)
-            if self.dut.AWREADY.value and self.dut.WREADY.value:
-                break
-
-        self.dut.AWVALID.value = 0
-        self.dut.WVALID.value = 0
-
-        # Wait for write response
-        self.dut.BREADY.value = 1
-        while True:
-            await RisingEdge(self.clk)
-            if self.dut.BVALID.value:
-                break
-
-        self.dut.BREADY.value = 0
+            if b_wait:
+                if self.bvalid.value:
+                    break
+                continue
+            drops = []
+            if not aw_done and self.awready.value:
+                drops.append((self.awvalid, 0))
+                aw_done = True
+            if not w_done and self.wready.value:
+                drops.append((self.wvalid, 0))
+                w_done = True
+            if drops:
+                set_values(drops)
+            if aw_done and w_done:
+                # Wait for write response
+                self.bready.value = 1
+                b_wait = True
+
+        self.bready.value = 0
 
     async def read(self, addr):
         # Read address
-        self.dut.ARADDR.value = addr
-        self.dut.ARVALID.value = 1
+        self.araddr.value = addr
+        self.arvalid.value = 1
 
-        # Wait for address handshake
+        ar_done = False
         while True:
             await RisingEdge(self.clk)
-            if self.dut.ARREADY.value:
-                break
-
-        self.dut.ARVALID.value = 0
-
-        # Wait for read data
-        self.dut.RREADY.value = 1
-        while True:
-            await RisingEdge(self.clk)
-            if self.dut.RVALID.value:
-                data = int(self.dut.RDATA.value)
-                break
-
-        self.dut.RREADY.value = 0
+            if ar_done:
+                if self.rvalid.value:
+                    data = get_uint32(self.rdata)
+                    break
+            elif self.arready.value:
+                self.arvalid.value = 0
+                # Wait for read data
+                self.rready.value = 1
+                ar_done = True
+
+        self.rready.value = 0
         return data
 
 @conditional_cocotb_test()
@@ -104,17 +149,37 @@ async def axil_simple_test(dut):
     while dut.ARESETn.value == 0:
         await RisingEdge(clk)
 
+    # Generate the whole random workload up front
+    n = 1_000_000
+    # Seeded from the global RNG, which cocotb seeds from COCOTB_RANDOM_SEED
+    rng = np.random.default_rng(random.getrandbits(64))
+    addrs = rng.integers(0, 1024, size=n, dtype=np.uint32)
+    datas = rng.integers(0, 1 << 32, size=n, dtype=np.uint32)
+    addrs_rd = rng.integers(0, 1024, size=n, dtype=np.uint32)
+
     mem = [0] * 1024
 
-    for _ in range(1_000_000):
-        addr = random.randint(0, 1023)
-        data = random.randint(0, 0xFFFFFFFF)
-        mem[addr] = data
-        await driver.write(addr * 4, data)
+    # Convert to Python ints one chunk at a time to bound memory use
+    chunk = 1 << 16
+    for start in range(0, n, chunk):
+        addrs_wr_chunk = addrs[start : start + chunk]
+        addrs_rd_chunk = addrs_rd[start : start + chunk]
+
+        # Byte addresses for the bus, word indices for the reference memory
+        workload = zip(
+            addrs_wr_chunk.tolist(),
+            (addrs_wr_chunk << 2).tolist(),
+            datas[start : start + chunk].tolist(),
+            addrs_rd_chunk.tolist(),
+            (addrs_rd_chunk << 2).tolist(),
+        )
+
+        for addr, byte_addr, data, addr_rd, byte_addr_rd in workload:
+            mem[addr] = data
+            await driver.write(byte_addr, data)
 
-        addr_rd = random.randint(0, 1023)
-        data_rd = await driver.read(addr_rd * 4)
-        assert data_rd == mem[addr_rd], f"Read backaddress {addr_rd} 0x{data_rd:08X} from memory 0x{mem[addr_rd]:08X}"
+            data_rd = await driver.read(byte_addr_rd)
+            assert data_rd == mem[addr_rd], f"Read backaddress {addr_rd} 0x{data_rd:08X} from memory 0x{mem[addr_rd]:08X}"
 
     await driver.write(0x100, 0xDEADBEEF)
     data = await driver.read(0x100)
@@ -122,55 +187,30 @@ async def axil_simple_test(dut):
 
     await Timer(10, unit="ns")
 
-def _get_installed_pkg_dir(pkg_name: str) -> Path:
-    spec = importlib.util.find_spec(pkg_name)
-    if spec is None or not spec.submodule_search_locations:
-        raise RuntimeError(f"{pkg_name} is not installed")
-    return Path(next(iter(spec.submodule_search_locations))).resolve()
-
-
-def _get_installed_cocotb_cpp_entry_path() -> Path:
-    pkg_dir = _get_installed_pkg_dir("cocotb_cpp")
-    candidates = sorted(pkg_dir.glob("cocotb_cpp_entry*"))
-    shared = [p for p in candidates if p.suffix in {".so", ".dylib", ".pyd"}]
-    if not shared:
-        raise RuntimeError(f"Could not find cocotb_cpp_entry shared library in {pkg_dir}")
-    return shared[0]
 
 @pytest.mark.parametrize("use_cpp", [True, False])
 def test_axil_runner(use_cpp):
-    
-    shutil.rmtree("sim_build", ignore_errors=True)
-
     sim = os.getenv("SIM", "icarus")
 
     proj_path = Path(__file__).resolve().parent
 
     sources = [proj_path / "axil.sv"]
 
-    if use_cpp:
-        entry_so = _get_installed_cocotb_cpp_entry_path()
-        extra_env = {
-                "GPI_USERS": f"{entry_so},cocotb_entry_point",
-                "COCOTB_MODULE": "test_axil",
-                "COCOTB_TEST": "axil_simple_test",
-                "COCOTB_CPP_TESTS": str(Path(__file__).resolve().parent),
-            }
-        test_module = ""
-        # do not check for xml results file for now
-        os.environ.pop("PYTEST_CURRENT_TEST", None)
-    else:
-        extra_env = {}
-        test_module = "test_axil,"
+    build_dir = sim_build_dir("test_axil_runner_cpp" if use_cpp else "test_axil_runner")
 
     runner = get_runner(sim)
-    runner.build(
-        sources=sources,
-        hdl_toplevel="top",
-        always=True,
-    )
+    build_hdl(runner, sim, sources, hdl_toplevel="top", build_dir=build_dir)
 
-    runner.test(hdl_toplevel="top", test_module=test_module, extra_env=extra_env)
+    if use_cpp:
+        env = {
+            "COCOTB_MODULE": "test_axil",
+            "COCOTB_TEST": "axil_simple_test",
+            "COCOTB_CPP_TESTS": str(proj_path),
+        }
+        entry = (entry_library(), "cocotb_entry_point")
+        run_native_test(runner, hdl_toplevel="top", entry=entry, env=env)
+    else:
+        runner.test(hdl_toplevel="top", test_module="test_axil")
 
 
 if __name__ == "__main__":
@@ -2,15 +2,14 @@
 # SPDX-License-Identifier: CC0-1.0
 import os
 from pathlib import Path
-import shutil
 
+from cocotb_cpp.runner import build_hdl, run_native_test
 from cocotb_tools.runner import get_runner
 
-from cmake_build import build_cpp_test_lib
+from cmake_build import build_cpp_test_lib, sim_build_dir
 
 
 def test_axil_cpp_runner():
-    shutil.rmtree("sim_build", ignore_errors=True)
     sim = os.getenv("SIM", "icarus")
 
     proj_path = Path(__file__).resolve().parent
@@ -18,19 +17,11 @@ def test_axil_cpp_runner():
     sources = [proj_path / "axil.sv"]
 
     cpp_so = build_cpp_test_lib(proj_path, "cocotb_test_axil", "lib_axil")
-    extra_env = {"GPI_USERS": f"{cpp_so},cocotb_entry_point"}
 
     runner = get_runner(sim)
-    runner.build(
-        sources=sources,
-        hdl_toplevel="top",
-        always=True,
-    )
+    build_hdl(runner, sim, sources, hdl_toplevel="top", build_dir=sim_build_dir("test_axil_cpp_runner"))
 
-    # do not check for xml results file for now
-    os.environ.pop("PYTEST_CURRENT_TEST", None)
-
-    runner.test(hdl_toplevel="top", test_module="", extra_env=extra_env)
+    run_native_test(runner, hdl_toplevel="top", entry=(cpp_so, "cocotb_entry_point"))
 
 
 if __name__ == "__main__":
@@ -9,8 +9,11 @@ from pathlib import Path
 import cocotb
 from cocotb.clock import Clock
 from cocotb.triggers import RisingEdge, Timer
+from cocotb_cpp.runner import build_hdl
 from cocotb_tools.runner import get_runner
 
+from cmake_build import sim_build_dir
+
 
 @cocotb.test()
 async def dff_test(dut):
@@ -69,11 +72,7 @@ def test_dff_runner():
     sources = [proj_path / "dff.sv"]
 
     runner = get_runner(sim)
-    runner.build(
-        sources=sources,
-        hdl_toplevel="dff",
-        always=True,
-    )
+    build_hdl(runner, sim, sources, hdl_toplevel="dff", build_dir=sim_build_dir("test_dff_runner"))
 
     runner.test(hdl_toplevel="dff", test_module="test_dff,")
 
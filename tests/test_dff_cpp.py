@@ -3,36 +3,29 @@
 
 import os
 from pathlib import Path
-import shutil
 
+from cocotb_cpp.runner import build_hdl, run_native_test
 from cocotb_tools.runner import get_runner
 
-from cmake_build import build_cpp_test_lib
+from cmake_build import build_cpp_test_lib, prebuilt_cpp_test_lib, sim_build_dir
 
 
 def test_dff_cpp_runner():
-    shutil.rmtree("sim_build", ignore_errors=True)
-
     sim = os.getenv("SIM", "icarus")
 
     proj_path = Path(__file__).resolve().parent
 
     sources = [proj_path / "dff.sv"]
 
-    cpp_so = build_cpp_test_lib(proj_path, "cocotb_test_dff", "lib_dff")
-    extra_env = {"GPI_USERS": f"{cpp_so},cocotb_entry_point"}
+    # Installs built with COCOTB_CPP_TEST_LIBS=ON ship lib_dff; otherwise build it here
+    cpp_so = prebuilt_cpp_test_lib(proj_path, "test_dff.cpp", "lib_dff")
+    if cpp_so is None:
+        cpp_so = build_cpp_test_lib(proj_path, "cocotb_test_dff", "lib_dff")
 
     runner = get_runner(sim)
-    runner.build(
-        sources=sources,
-        hdl_toplevel="dff",
-        always=True,
-    )
-
-    # do not check for xml results file for now
-    os.environ.pop("PYTEST_CURRENT_TEST", None)
+    build_hdl(runner, sim, sources, hdl_toplevel="dff", build_dir=sim_build_dir("test_dff_cpp_runner"))
 
-    runner.test(hdl_toplevel="dff", test_module="", extra_env=extra_env)
+    run_native_test(runner, hdl_toplevel="dff", entry=(cpp_so, "cocotb_entry_point"))
 
 
 if __name__ == "__main__":
@@ -3,49 +3,49 @@
 
 import os
 from pathlib import Path
-import shutil
 
 import cocotb_tools.config
 from cocotb_tools.runner import get_runner
+from cocotb_cpp.runner import build_digest, build_hdl, run_native_test, stamp_matches, write_stamp
 import subprocess
 import pytest
 
+from cmake_build import sim_build_dir
+
 
 @pytest.mark.xfail(reason="expected failure")
 def test_failure_runner():
-    shutil.rmtree("sim_build", ignore_errors=True)
-
     sim = os.getenv("SIM", "icarus")
 
     proj_path = Path(__file__).resolve().parent
 
     sources = [proj_path / "dff.sv"]
 
+    build_dir = sim_build_dir("test_failure_runner")
+
     cpp_src = proj_path / "test_failure.cpp"
-    cpp_so = Path("sim_build/lib_failure.so").resolve()
+    cpp_so = build_dir / "lib_failure.so"
+    src_path = proj_path / ".." / "src"
     cocotb_include_path = cocotb_tools.config.share_dir / "include"
-    extra_env = {"GPI_USERS": f"{cpp_so},cocotb_entry_point"}
     build_cpp_cmd = f"gcc -x c++ -std=c++20 -fPIC -shared \
         -Wall -Wextra -Wpedantic \
-        -I. -I{proj_path / ".." / "src"} -I{cocotb_include_path} {cpp_src} \
+        -I. -I{src_path} -I{cocotb_include_path} {cpp_src} \
         -lstdc++ \
         -o {cpp_so}".split()
 
     runner = get_runner(sim)
-    runner.build(
-        sources=sources,
-        hdl_toplevel="dff",
-        always=True,
-    )
-
-    result = subprocess.run(build_cpp_cmd)
-    if result.returncode != 0:
-        raise RuntimeError(f"Failed to build C++ shared library (exit code {result.returncode})")
-
-    # do not check for xml results file for now
-    os.environ.pop("PYTEST_CURRENT_TEST", None)
-
-    runner.test(hdl_toplevel="dff", test_module="", extra_env=extra_env)
+    build_hdl(runner, sim, sources, hdl_toplevel="dff", build_dir=build_dir)
+
+    # Only recompile when the sources, headers or command line changed
+    so_stamp = cpp_so.with_name(cpp_so.name + ".hash")
+    so_digest = build_digest(cpp_src, *sorted(src_path.glob("*.h")), *build_cpp_cmd)
+    if not (cpp_so.is_file() and stamp_matches(so_stamp, so_digest)):
+        result = subprocess.run(build_cpp_cmd)
+        if result.returncode != 0:
+            raise RuntimeError(f"Failed to build C++ shared library (exit code {result.returncode})")
+        write_stamp(so_stamp, so_digest)
+
+    run_native_test(runner, hdl_toplevel="dff", entry=(cpp_so, "cocotb_entry_point"))
 
 
 if __name__ == "__main__":